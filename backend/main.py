@@ -1,18 +1,32 @@
 # backend/main.py
+import asyncio
+import contextlib
+import copy
+import logging
 import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+from config import settings
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 
 # Import routes
 from routes.albums import router as albums_router
+from routes.dependencies import redis_client
 from routes.monitor import router as monitor_router
 from routes.search import router as search_router
+from services.cockroach import close_pool, init_pool
+from services.monitor import monitor
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("main")
 
 # Set up templates
 templates_directory = Path(__file__).parent / "templates"
@@ -21,8 +35,67 @@ templates = Jinja2Templates(directory=str(templates_directory))
 # Create templates directory if it doesn't exist
 os.makedirs(str(templates_directory), exist_ok=True)
 
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    Queue records unformatted. The stdlib prepare() formats the record on the
+    logging thread; this leaves msg, args and exc_info for the listener's
+    handlers to format instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+def start_log_listener() -> QueueListener:
+    """
+    Route all logging through a queue so formatting and stream writes
+    happen on a background thread instead of the event loop
+    """
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    handlers = root.handlers or [logging.StreamHandler()]
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    root.handlers = [DeferredFormatQueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def stop_log_listener(listener: QueueListener):
+    """Flush queued records and hand the original handlers back to the root logger"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
+    # Open the database pool up front so the first request doesn't pay for it.
+    # An unreachable database must not stop the app starting; get_db() retries
+    # on first use and the monitor reports the database as unhealthy meanwhile
+    try:
+        await init_pool()
+    except Exception:
+        logger.exception("Database pool warm-up failed, will retry on first use")
+    # Check services in the background so health endpoints never block on them
+    checker = asyncio.create_task(monitor.run_periodic_checks())
+    try:
+        yield
+    finally:
+        # Let an in-flight check finish unwinding before its clients close
+        checker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await checker
+        await redis_client.aclose()
+        await close_pool()
+        stop_log_listener(log_listener)
+
+
 # Create the FastAPI app with the lifespan
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="StreamClout API",
     description="""
     API to get historical Spotify streaming data for any album and track.
@@ -44,6 +117,47 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+
+class UnhandledErrorMiddleware:
+    """
+    Turn unexpected route errors into a logged 500. Added before CORS so the
+    CORS layer wraps it and error responses still carry its headers. Plain
+    ASGI rather than BaseHTTPMiddleware, so it costs no extra task or stream
+    per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # HTTPExceptions are answered further in and never reach here
+            logger.exception("Unhandled error on %s %s", scope["method"], scope["path"])
+            # Too late to send a 500 once the response is underway
+            if response_started:
+                raise
+            response = ORJSONResponse(
+                status_code=500, content={"detail": "Internal server error"}
+            )
+            await response(scope, receive, send)
+
+
+app.add_middleware(UnhandledErrorMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -66,8 +180,8 @@ class ProxyHeadersMiddleware(BaseHTTPMiddleware):
         forwarded_for = request.headers.get("X-Forwarded-For")
         if forwarded_for:
             # Log forwarded IP for debugging
-            print(f"Original client host: {request.client.host}")
-            print(f"Forwarded for: {forwarded_for}")
+            logger.debug("Original client host: %s", request.client.host)
+            logger.debug("Forwarded for: %s", forwarded_for)
 
         response = await call_next(request)
         return response
@@ -75,6 +189,7 @@ class ProxyHeadersMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(ProxyHeadersMiddleware)
 
+
 # Include routers
 app.include_router(albums_router, prefix="/albums", tags=["Albums"])
 app.include_router(search_router, prefix="/search", tags=["Search"])
@@ -86,12 +201,7 @@ app.include_router(
 # Update the health check endpoint to include service status and show dashboard
 @app.get("/", response_class=HTMLResponse, tags=["Health"], include_in_schema=False)
 async def health_check(request: Request):
-    from services.monitor import monitor
-
-    # Run a check of all services
-    await monitor.check_all_services()
-
-    # Get service status summary
+    # Get the latest service status summary from the background checker
     status_summary = monitor.get_status_summary()
 
     # Pass the data to the template
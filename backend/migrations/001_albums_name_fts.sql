@@ -0,0 +1,7 @@
+-- Full-text search column and inverted index behind DatabaseService.search_albums
+ALTER TABLE albums ADD COLUMN IF NOT EXISTS name_tsv TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(artist_name, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS albums_name_tsv_idx ON albums USING GIN (name_tsv);
@@ -0,0 +1,3 @@
+-- Trigram index so the substring ILIKE fallback in DatabaseService.search_albums
+-- can use an index instead of scanning every album name
+CREATE INDEX IF NOT EXISTS albums_name_trgm_idx ON albums USING GIN (name gin_trgm_ops);
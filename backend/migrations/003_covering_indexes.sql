@@ -0,0 +1,14 @@
+-- Covering indexes for the read paths in DatabaseService, so each query can be
+-- answered from the index without going back to the table rows
+
+-- fetch_album_data: one album's streams within the time window
+CREATE INDEX IF NOT EXISTS streams_album_timestamp_idx ON streams (album_id, timestamp)
+    STORING (track_id, play_count);
+
+-- fetch_top_tracks: every non-zero stream within the time window
+CREATE INDEX IF NOT EXISTS streams_timestamp_idx ON streams (timestamp)
+    STORING (album_id, track_id, play_count)
+    WHERE play_count > 0;
+
+-- fetch_album_data: the album's tracks, including ones with no recent streams
+CREATE INDEX IF NOT EXISTS tracks_album_id_idx ON tracks (album_id) STORING (name);
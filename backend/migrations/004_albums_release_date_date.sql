@@ -0,0 +1,7 @@
+-- Albums only ever carry a calendar release date, so store it as DATE and let
+-- reads return it without a per-row ::date cast.
+-- Changing a column's type rewrites it, which CockroachDB gates behind this
+-- setting; run outside an explicit transaction
+SET enable_experimental_alter_column_type_general = true;
+
+ALTER TABLE albums ALTER COLUMN release_date TYPE DATE USING release_date::date;
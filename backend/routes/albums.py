@@ -1,7 +1,7 @@
 # routes/albums.py
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
@@ -65,71 +65,65 @@ class StreamResponse(BaseModel):
 )
 async def fetch_album(
     album_id: str,
-    time_period: str = Query(
+    time_period: Literal["7d", "30d"] = Query(
         default="7d",
-        regex="^(7d|30d)$",
         description="Time period for percentage change calculation (7d or 30d)",
     ),
     spotify_services=Depends(get_spotify_services),
     db_service=Depends(get_database_service),
 ):
     """Fetch album details and tracks from database, then unofficial, then official Spotify API."""
-    try:
-        # 1. Try to get album data from the database
-        db_result = await db_service.fetch_album_data(album_id, time_period)
-        if db_result:
-            return db_result
+    # 1. Try to get album data from the database
+    db_result = await db_service.fetch_album_data(album_id, time_period)
+    if db_result:
+        return db_result
 
-        # 2. Try to get album data from the unofficial Spotify API
-        try:
-            streams = await spotify_services["unofficial"].get_album_tracks(album_id)
-            # Try to extract cover art from the first stream or from album data
-            cover_art_url = None
-            if streams and hasattr(streams[0], "cover_art") and streams[0].cover_art:
-                cover_art_url = streams[0].cover_art
-            else:
-                # Try to get cover art from the official API as a fallback
-                album_details = await spotify_services["official"].get_album(album_id)
-                if album_details and album_details["images"]:
-                    cover_art_url = album_details["images"][0]["url"]
-            # Set cover_art for all streams
-            if cover_art_url:
-                for stream in streams:
-                    stream.cover_art = cover_art_url
-                    stream.pct_change = 0.0  # Will be calculated if saved to DB
-                    stream.time_period = time_period
-            if streams:
-                await db_service.save_complete_album(streams)
-                return streams
-        except Exception as unofficial_error:
-            logger.warning(f"Unofficial Spotify API failed: {unofficial_error}")
+    # 2. Try to get album data from the unofficial Spotify API
+    try:
+        streams = await spotify_services["unofficial"].get_album_tracks(album_id)
+        # Try to extract cover art from the first stream or from album data
+        cover_art_url = None
+        if streams and hasattr(streams[0], "cover_art") and streams[0].cover_art:
+            cover_art_url = streams[0].cover_art
+        else:
+            # Try to get cover art from the official API as a fallback
+            album_details = await spotify_services["official"].get_album(album_id)
+            if album_details and album_details["images"]:
+                cover_art_url = album_details["images"][0]["url"]
+        # Set cover_art for all streams
+        if cover_art_url:
+            for stream in streams:
+                stream.cover_art = cover_art_url
+                stream.pct_change = 0.0  # Will be calculated if saved to DB
+                stream.time_period = time_period
+        if streams:
+            await db_service.save_complete_album(streams)
+            return streams
+    except Exception as unofficial_error:
+        logger.warning("Unofficial Spotify API failed: %s", unofficial_error)
 
-        # 3. Fallback to official Spotify API (metadata only, no stream counts)
-        album_details = await spotify_services["official"].get_album(album_id)
-        if not album_details:
-            raise HTTPException(status_code=404, detail="Album not found")
+    # 3. Fallback to official Spotify API (metadata only, no stream counts)
+    album_details = await spotify_services["official"].get_album(album_id)
+    if not album_details:
+        raise HTTPException(status_code=404, detail="Album not found")
 
-        streams = []
-        for track in album_details["tracks"]["items"]:
-            streams.append(
-                StreamResponse(
-                    track_id=track["id"],
-                    track_name=track["name"],
-                    album_id=album_details["id"],
-                    album_name=album_details["name"],
-                    artist_name=album_details["artists"][0]["name"],
-                    stream_count=0,
-                    timestamp=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    cover_art=album_details["images"][0]["url"]
-                    if album_details["images"]
-                    else None,
-                    pct_change=0.0,
-                    time_period=time_period,
-                )
+    streams = []
+    for track in album_details["tracks"]["items"]:
+        streams.append(
+            StreamResponse(
+                track_id=track["id"],
+                track_name=track["name"],
+                album_id=album_details["id"],
+                album_name=album_details["name"],
+                artist_name=album_details["artists"][0]["name"],
+                stream_count=0,
+                timestamp=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                cover_art=album_details["images"][0]["url"]
+                if album_details["images"]
+                else None,
+                pct_change=0.0,
+                time_period=time_period,
             )
-        await db_service.save_complete_album(streams)
-        return streams
-
-    except Exception as e:
-        logger.error(f"Error fetching album {album_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        )
+    await db_service.save_complete_album(streams)
+    return streams
@@ -1,4 +1,7 @@
 # routes/dependencies.py
+import hmac
+
+import redis.asyncio as redis
 from config import settings
 from fastapi import Header, HTTPException, status
 from services.cockroach import DatabaseService
@@ -10,6 +13,10 @@ token_manager = TokenManager()
 unofficial_spotify = UnofficialSpotifyService(token_manager)
 official_spotify = OfficialSpotifyService()
 db_service = DatabaseService()
+redis_client = redis.from_url(settings.REDIS_URL)
+
+# Encode the admin key once so each request only pays for the comparison
+_ADMIN_KEY = settings.API_KEY.encode() if settings.API_KEY else b""
 
 
 # Services dependencies to be used in routes
@@ -20,6 +27,13 @@ def get_spotify_services():
     return {"unofficial": unofficial_spotify, "official": official_spotify}
 
 
+def get_official_spotify():
+    """
+    Returns the official Spotify API service
+    """
+    return official_spotify
+
+
 def get_database_service():
     """
     Returns the database service instance
@@ -27,8 +41,16 @@ def get_database_service():
     return db_service
 
 
+def get_redis():
+    """
+    Returns the shared Redis client used for response caching
+    """
+    return redis_client
+
+
 def verify_api_key(x_api_key: str = Header(..., alias="X-API-Key")):
-    if not settings.API_KEY or x_api_key != settings.API_KEY:
+    # Constant-time compare so the key can't be recovered through response timing
+    if not _ADMIN_KEY or not hmac.compare_digest(x_api_key.encode(), _ADMIN_KEY):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key",
@@ -4,11 +4,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from services.monitor import monitor
 
+from .caching import etag_matches
 from .dependencies import verify_api_key
 
 # Set up templates
@@ -22,18 +23,22 @@ router = APIRouter(dependencies=[Depends(verify_api_key)])
 
 
 @router.get("/health", summary="Get service health status")
-async def get_health_status() -> Dict[str, Any]:
+async def get_health_status(request: Request) -> Response:
     """
     Get the health status of all services.
 
+    Statuses are refreshed by the background checker started in the app
+    lifespan, so this only reads the latest result. Clients that send a
+    matching If-None-Match get a 304 while nothing has changed.
+
     Returns:
         Dictionary containing overall status and individual service statuses
     """
-    # Run a check of all services
-    await monitor.check_all_services()
-    status = monitor.get_status_summary()
+    etag = monitor.get_status_etag()
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-    return status
+    return ORJSONResponse(monitor.get_status_summary(), headers={"ETag": etag})
 
 
 @router.post("/check", summary="Run a check of all services")
@@ -1,24 +1,96 @@
 # routes/search.py
-import time
-import traceback
-from datetime import datetime
-from typing import List
+import asyncio
+import hashlib
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
 from models import DatabaseAlbum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from routes.caching import etag_matches
 from routes.dependencies import (
     get_database_service,
-    get_spotify_services,
+    get_official_spotify,
+    get_redis,
     verify_api_key,
 )
 
+logger = logging.getLogger("search_routes")
+
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
-# Add a simple in-memory cache for top tracks
-_top_tracks_cache = {}
-_top_tracks_cache_time = {}
+# Top tracks are cached in Redis so every API worker shares one copy
 _TOP_TRACKS_CACHE_TTL = 60 * 60  # 1 hour in seconds
+_TOP_TRACKS_CACHE_PREFIX = "api:top_tracks:"
+# In-flight loads per key, so concurrent misses in this worker share one query
+_top_tracks_inflight: Dict[str, asyncio.Future] = {}
+
+# How long browsers and CDNs may reuse a search response
+_SEARCH_CACHE_MAX_AGE = 5 * 60  # 5 minutes in seconds
+# Spotify search only pages through its first 1000 results and rejects
+# requests for anything past them
+_SPOTIFY_SEARCH_MAX_RESULTS = 1000
+
+
+def _with_etag(body: bytes) -> Tuple[bytes, str]:
+    """Pair an encoded body with an ETag derived from its bytes"""
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _encode_json(payload: Any) -> Tuple[bytes, str]:
+    """Encode a payload once and derive its ETag from the encoded bytes"""
+    return _with_etag(orjson.dumps(payload))
+
+
+def _json_response(request: Request, body: bytes, etag: str, max_age: int) -> Response:
+    """Serve encoded JSON with caching headers, or a 304 if the client already has it"""
+    # Every route here needs an API key, so shared caches must key on it too
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Vary": "X-API-Key",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _get_cached_top_tracks(
+    redis, cache_key: str
+) -> Optional[Tuple[bytes, str, int]]:
+    """Read an encoded top tracks payload, its ETag and seconds left from Redis"""
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hmget(cache_key, "body", "etag")
+            pipe.ttl(cache_key)
+            (body, etag), ttl = await pipe.execute()
+    except Exception:
+        logger.warning("Top tracks cache read failed", exc_info=True)
+        return None
+    if body is None or etag is None:
+        return None
+    return body, etag.decode(), max(ttl, 0)
+
+
+async def _set_cached_top_tracks(redis, cache_key: str, body: bytes, etag: str):
+    """Store an encoded top tracks payload and its ETag in Redis"""
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(cache_key, mapping={"body": body, "etag": etag})
+            pipe.expire(cache_key, _TOP_TRACKS_CACHE_TTL)
+            await pipe.execute()
+    except Exception:
+        logger.warning("Top tracks cache write failed", exc_info=True)
+
+
+def _iso_date(value: Union[date, str]) -> str:
+    """Format a date or datetime as YYYY-MM-DD; strings are passed through"""
+    if isinstance(value, str):
+        return value
+    # isoformat is a C fast path, unlike strftime's format parsing
+    return value.isoformat()[:10]
 
 
 class AlbumSearchResponse(BaseModel):
@@ -35,14 +107,18 @@ class AlbumSearchResponse(BaseModel):
     def from_database_album(
         cls, album: "DatabaseAlbum", total_tracks: int = 0
     ) -> "AlbumSearchResponse":
-        """Convert a DatabaseAlbum to AlbumSearchResponse"""
-        return cls(
+        """
+        Convert a DatabaseAlbum to AlbumSearchResponse without re-validating.
+        Database rows arrive unvalidated, so nullable columns fall back to ""
+        to keep every field the string the response model promises.
+        """
+        return cls.model_construct(
             album_id=album.album_id,
-            album_name=album.name,
-            artist_name=album.artist_name,
-            release_date=album.release_date.strftime("%Y-%m-%d"),
+            album_name=album.name or "",
+            artist_name=album.artist_name or "",
+            release_date=_iso_date(album.release_date) if album.release_date else "",
             total_tracks=total_tracks,
-            cover_art=getattr(album, "cover_art", ""),
+            cover_art=getattr(album, "cover_art", "") or "",
         )
 
 
@@ -68,6 +144,20 @@ class TopTrackResponse(BaseModel):
     )
 
 
+# Serializes a whole result list in one pass through pydantic-core
+_ALBUM_LIST_ADAPTER = TypeAdapter(List[AlbumSearchResponse])
+
+
+def _album_search_response(
+    request: Request, albums: List[DatabaseAlbum]
+) -> Response:
+    """Convert albums from any source and serve them with search caching headers"""
+    body = _ALBUM_LIST_ADAPTER.dump_json(
+        [AlbumSearchResponse.from_database_album(album) for album in albums]
+    )
+    return _json_response(request, *_with_etag(body), _SEARCH_CACHE_MAX_AGE)
+
+
 @router.get(
     "/albums",
     response_model=List[AlbumSearchResponse],
@@ -77,6 +167,7 @@ class TopTrackResponse(BaseModel):
 
     - `query`: The album name or keyword to search for (min 1 character)
     - `limit`: Maximum number of results to return (default: 10, max: 50)
+    - `offset`: Number of results to skip, for pagination (default: 0)
     - `force_spotify`: If true, always search Spotify API even if results are found in the database
 
     **Example:**
@@ -86,72 +177,83 @@ class TopTrackResponse(BaseModel):
     """,
 )
 async def search_albums(
+    request: Request,
     query: str = Query(
         ..., min_length=1, description="Album name or keyword to search for"
     ),
     limit: int = Query(
-        default=10, le=50, description="Maximum number of results to return (max 50)"
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of results to return (max 50)",
     ),
+    offset: int = Query(default=0, ge=0, description="Number of results to skip"),
     force_spotify: bool = Query(
         False, description="Force search on Spotify even if results found in database"
     ),
+    db_service=Depends(get_database_service),
+    official_spotify=Depends(get_official_spotify),
 ):
     """
     Search albums by name in database. If no results or force_spotify=True, search Spotify API.
     """
-    try:
-        # Get services
-        db_service = get_database_service()
-        spotify_services = get_spotify_services()
-        official_spotify = spotify_services["official"]
-
-        # If not forcing Spotify, try database first
-        if not force_spotify:
-            print(f"Searching database for query: {query}")
-            # First search in database
-            db_results = await db_service.search_albums(query)
-            print(
-                f"Database search results: {len(db_results) if db_results else 0} results"
-            )
-
-            # If we have results, return them
-            if db_results and len(db_results) > 0:
-                print("Returning database results")
-                return [
-                    AlbumSearchResponse.from_database_album(album)
-                    for album in db_results[:limit]
-                ]
-
-        # If we're forcing Spotify search or nothing was found in the database, search Spotify
-        print(f"Falling back to Spotify search for query: {query}")
-        try:
-            spotify_results = await official_spotify.search_albums(query, limit)
-            print(
-                f"Spotify search results: {len(spotify_results) if spotify_results else 0} results"
-            )
-
-            if not spotify_results:
-                print("No results found in Spotify either")
-                return []
-
-            return [
-                AlbumSearchResponse.from_database_album(album)
-                for album in spotify_results
-            ]
-
-        except Exception as e:
-            err_trace = traceback.format_exc()
-            print(f"Error searching Spotify API: {err_trace}")
-            raise HTTPException(
-                status_code=500, detail=f"Failed to search Spotify API: {str(e)}"
-            )
-
-    except Exception as e:
-        err_trace = traceback.format_exc()
-        print(f"Error searching albums: {err_trace}")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to search albums: {str(e)}"
-        )
+    # If not forcing Spotify, try database first
+    if not force_spotify:
+        logger.debug("Searching database for query: %s", query)
+        # First search in database
+        db_results = await db_service.search_albums(query, limit, offset)
+        logger.debug("Database search results: %d results", len(db_results))
+
+        # If we have results, return them
+        if db_results:
+            logger.debug("Returning database results")
+            return _album_search_response(request, db_results)
+
+        # An empty page past the end of the database's matches ends the
+        # results; only page through Spotify when the database has none at all
+        if offset and await db_service.search_albums(query, 1, 0):
+            logger.debug("No more database results for query: %s", query)
+            return _album_search_response(request, [])
+
+    # If we're forcing Spotify search or nothing was found in the database, search Spotify
+    if offset >= _SPOTIFY_SEARCH_MAX_RESULTS:
+        logger.debug("Offset %d is past Spotify's search results", offset)
+        return _album_search_response(request, [])
+    limit = min(limit, _SPOTIFY_SEARCH_MAX_RESULTS - offset)
+
+    logger.debug("Falling back to Spotify search for query: %s", query)
+    spotify_results = await official_spotify.search_albums(query, limit, offset)
+    logger.debug("Spotify search results: %d results", len(spotify_results))
+
+    if not spotify_results:
+        logger.debug("No results found in Spotify either")
+
+    return _album_search_response(request, spotify_results)
+
+
+async def _load_top_tracks(
+    db_service, redis, cache_key: str, time_period: str
+) -> Tuple[bytes, str]:
+    """Query top tracks, then encode and cache the result with its ETag"""
+    db_results = await db_service.fetch_top_tracks(time_period)
+    # Add release_date to each result
+    result = []
+    for stream in db_results:
+        d = stream.model_dump()
+        # Convert release_date to string if it's a datetime
+        if isinstance(d.get("release_date"), datetime):
+            d["release_date"] = _iso_date(d["release_date"])
+        # Try to get release_date from stream if present, else empty string
+        d["release_date"] = d.get("release_date", "") or ""
+        # Ensure pct_change is included and add time_period
+        d["pct_change"] = d.get("pct_change") or 0.0
+        d["time_period"] = time_period
+        result.append(d)
+
+    # Cache the encoded result and its ETag for this time period
+    body, etag = _encode_json(result)
+    await _set_cached_top_tracks(redis, cache_key, body, etag)
+    return body, etag
 
 
 @router.get(
@@ -170,53 +272,34 @@ async def search_albums(
     """,
 )
 async def top_tracks(
-    time_period: str = Query(
+    request: Request,
+    time_period: Literal["7d", "30d"] = Query(
         default="7d",
-        regex="^(7d|30d)$",
         description="Time period for percentage change calculation (7d or 30d)",
     ),
     db_service=Depends(get_database_service),
+    redis=Depends(get_redis),
     api_key=Depends(verify_api_key),
 ):
     """
     Get the top tracks by stream count from the database.
     """
-    global _top_tracks_cache, _top_tracks_cache_time
-    now = time.time()
-
-    # Check cache for this specific time period
-    cache_key = time_period
-    if (
-        cache_key in _top_tracks_cache
-        and cache_key in _top_tracks_cache_time
-        and (now - _top_tracks_cache_time[cache_key]) < _TOP_TRACKS_CACHE_TTL
-    ):
-        return _top_tracks_cache[cache_key]
+    # Check cache for this specific time period; clients may reuse the
+    # response only for as long as the cached copy has left to live
+    cache_key = _TOP_TRACKS_CACHE_PREFIX + time_period
+    cached = await _get_cached_top_tracks(redis, cache_key)
+    if cached:
+        return _json_response(request, *cached)
 
-    try:
-        # First search in database
-        db_results = await db_service.fetch_top_tracks(time_period)
-        # Add release_date to each result
-        result = []
-        for stream in db_results:
-            d = stream.model_dump()
-            # Convert release_date to string if it's a datetime
-            if isinstance(d.get("release_date"), datetime):
-                d["release_date"] = d["release_date"].strftime("%Y-%m-%d")
-            # Try to get release_date from stream if present, else empty string
-            d["release_date"] = d.get("release_date", "") or ""
-            # Ensure pct_change is included and add time_period
-            d["pct_change"] = d.get("pct_change") or 0.0
-            d["time_period"] = time_period
-            result.append(d)
-
-        # Cache the result for this time period
-        _top_tracks_cache[cache_key] = result
-        _top_tracks_cache_time[cache_key] = now
-        return result
-    except Exception as e:
-        err_trace = traceback.format_exc()
-        print(f"Error fetching top tracks: {err_trace}")
-        raise HTTPException(
-            status_code=500, detail=f"Failed to find top tracks: {str(e)}"
+    # Join a load that's already running, or start one that others can join
+    inflight = _top_tracks_inflight.get(cache_key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(
+            _load_top_tracks(db_service, redis, cache_key, time_period)
         )
+        _top_tracks_inflight[cache_key] = inflight
+        inflight.add_done_callback(lambda _: _top_tracks_inflight.pop(cache_key, None))
+
+    # Shield so a disconnecting client doesn't cancel the load for everyone
+    body, etag = await asyncio.shield(inflight)
+    return _json_response(request, body, etag, _TOP_TRACKS_CACHE_TTL)
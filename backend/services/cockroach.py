@@ -1,9 +1,8 @@
 # services/cockroach.py
 import logging
-import traceback
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import asyncpg
 from config import settings
@@ -12,14 +11,82 @@ from models import DatabaseAlbum, DatabaseStream, DatabaseTrack, StreamResponse
 logger = logging.getLogger(__name__)
 
 
+# Shared connection pool, created on first use or at app startup
+_pool: Optional[asyncpg.Pool] = None
+
+
+async def init_pool() -> asyncpg.Pool:
+    """Create the shared connection pool if it doesn't exist yet"""
+    global _pool
+    if _pool is None:
+        pool = await asyncpg.create_pool(
+            settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+        )
+        # Another caller may have created the pool while we were connecting
+        if _pool is None:
+            _pool = pool
+        else:
+            await pool.close()
+    return _pool
+
+
+async def close_pool():
+    """Close the shared connection pool"""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
+
+
 @asynccontextmanager
 async def get_db():
-    """Database connection context manager"""
-    conn = await asyncpg.connect(settings.DATABASE_URL)
-    try:
+    """Database connection context manager backed by the shared pool"""
+    pool = _pool or await init_pool()
+    async with pool.acquire() as conn:
         yield conn
-    finally:
-        await conn.close()
+
+
+def _parse_utc_timestamp(value: str) -> datetime:
+    """Parse a YYYY-MM-DDTHH:MM:SSZ string into a naive UTC datetime"""
+    # fromisoformat is a C fast path, unlike strptime's format parsing; it
+    # only learns the trailing Z in Python 3.11, so strip it first
+    return datetime.fromisoformat(value.rstrip("Z"))
+
+
+# Shared by insert_album and save_complete_album, so the two can't drift
+# apart and always hit one entry in each pooled connection's statement cache.
+# Re-scrapes mostly resend unchanged metadata, so only rewrite rows that differ
+_UPSERT_ALBUM_SQL = """
+    INSERT INTO albums (
+        album_id,
+        name,
+        artist_name,
+        cover_art,
+        release_date
+    )
+    VALUES (
+        $1,
+        $2,
+        $3,
+        $4,
+        $5
+    )
+    ON CONFLICT (
+        album_id
+    )
+    DO UPDATE SET
+        name = $2,
+        artist_name = $3,
+        cover_art = $4,
+        release_date = $5
+    WHERE (
+        albums.name, albums.artist_name, albums.cover_art, albums.release_date
+    ) IS DISTINCT FROM (
+        excluded.name, excluded.artist_name, excluded.cover_art, excluded.release_date
+    )
+"""
 
 
 class DatabaseService:
@@ -30,146 +97,121 @@ class DatabaseService:
     # 1. Insert Album query
     async def insert_album(self, album: DatabaseAlbum):
         """Insert album using the provided template"""
-        logger.info(f"[DB] Inserting album: {album}")
+        logger.info("[DB] Inserting album: %s", album)
         async with get_db() as conn:
-            async with conn.transaction():
-                try:
-                    await conn.execute(
-                        """
-                        INSERT INTO albums (
-                            album_id,
-                            name,
-                            artist_name,
-                            cover_art,
-                            release_date
-                        )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3,
-                            $4,
-                            $5
-                        )
-                        ON CONFLICT (
-                            album_id
-                        )
-                        DO UPDATE SET
-                            name = $2,
-                            artist_name = $3,
-                            cover_art = $4,
-                            release_date = $5
-                    """,
-                        album.album_id,
-                        album.name,
-                        album.artist_name,
-                        album.cover_art,
-                        album.release_date,
-                    )
-                    logger.info(f"[DB] Album inserted/updated: {album.album_id}")
-                except Exception:
-                    logger.error(
-                        f"[DB][EXCEPTION] Error inserting album: {album}\n{traceback.format_exc()}"
-                    )
-                    raise
+            try:
+                await conn.execute(
+                    _UPSERT_ALBUM_SQL,
+                    album.album_id,
+                    album.name,
+                    album.artist_name,
+                    album.cover_art,
+                    album.release_date,
+                )
+                logger.info("[DB] Album inserted/updated: %s", album.album_id)
+            except Exception:
+                logger.exception("[DB][EXCEPTION] Error inserting album: %s", album)
+                raise
 
     # 2. Insert Track query
     async def insert_track(self, track: DatabaseTrack):
         """Insert track using the provided template"""
-        logger.info(f"[DB] Inserting track: {track}")
+        logger.info("[DB] Inserting track: %s", track)
         async with get_db() as conn:
-            async with conn.transaction():
-                try:
-                    await conn.execute(
-                        """
-                        INSERT INTO tracks (
-                            track_id,
-                            name,
-                            album_id
-                        )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3
-                        )
-                        ON CONFLICT (
-                            track_id
-                        )
-                        DO UPDATE
-                        SET
-                            name = $2,
-                            album_id = $3
-                    """,
-                        track.track_id,
-                        track.track_name,
-                        track.album_id,
+            try:
+                await conn.execute(
+                    """
+                    INSERT INTO tracks (
+                        track_id,
+                        name,
+                        album_id
                     )
-                    logger.info(f"[DB] Track inserted/updated: {track.track_id}")
-                except Exception:
-                    logger.error(
-                        f"[DB][EXCEPTION] Error inserting track: {track}\n{traceback.format_exc()}"
+                    VALUES (
+                        $1,
+                        $2,
+                        $3
                     )
-                    raise
+                    ON CONFLICT (
+                        track_id
+                    )
+                    DO UPDATE
+                    SET
+                        name = $2,
+                        album_id = $3
+                    WHERE (tracks.name, tracks.album_id)
+                        IS DISTINCT FROM (excluded.name, excluded.album_id)
+                """,
+                    track.track_id,
+                    track.track_name,
+                    track.album_id,
+                )
+                logger.info("[DB] Track inserted/updated: %s", track.track_id)
+            except Exception:
+                logger.exception("[DB][EXCEPTION] Error inserting track: %s", track)
+                raise
 
     # 3. Insert Stream query
     async def insert_stream(self, stream: DatabaseStream):
         """Insert stream using the provided template"""
-        logger.info(f"[DB] Inserting stream: {stream}")
+        logger.info("[DB] Inserting stream: %s", stream)
         async with get_db() as conn:
-            async with conn.transaction():
-                try:
-                    await conn.execute(
-                        """
-                        INSERT INTO streams (
-                            track_id,
-                            play_count,
-                            album_id,
-                            timestamp
-                        )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3,
-                            $4
-                        )
-                        ON CONFLICT (
-                            track_id,
-                            play_count,
-                            album_id
-                        )
-                        DO NOTHING
-                    """,
-                        stream.track_id,
-                        stream.play_count,
-                        stream.album_id,
-                        stream.timestamp,
+            try:
+                await conn.execute(
+                    """
+                    INSERT INTO streams (
+                        track_id,
+                        play_count,
+                        album_id,
+                        timestamp
                     )
-                    logger.info(
-                        f"[DB] Stream inserted: {stream.track_id} play_count={stream.play_count} album_id={stream.album_id}"
+                    VALUES (
+                        $1,
+                        $2,
+                        $3,
+                        $4
                     )
-                except Exception:
-                    logger.error(
-                        f"[DB][EXCEPTION] Error inserting stream: {stream}\n{traceback.format_exc()}"
+                    ON CONFLICT (
+                        track_id,
+                        play_count,
+                        album_id
                     )
-                    raise
+                    DO NOTHING
+                """,
+                    stream.track_id,
+                    stream.play_count,
+                    stream.album_id,
+                    stream.timestamp,
+                )
+                logger.info(
+                    "[DB] Stream inserted: %s play_count=%s album_id=%s",
+                    stream.track_id,
+                    stream.play_count,
+                    stream.album_id,
+                )
+            except Exception:
+                logger.exception("[DB][EXCEPTION] Error inserting stream: %s", stream)
+                raise
 
     # 5. Check Album Existence query
     async def check_album_exists(self, album_id: str) -> bool:
         """Check if album exists using the provided template"""
         async with get_db() as conn:
-            result = await conn.fetchval(
+            return await conn.fetchval(
                 """
-                SELECT album_id
-                FROM   albums
-                WHERE  album_id = $1
-                LIMIT  10
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM   albums
+                    WHERE  album_id = $1
+                )
             """,
                 album_id,
             )
-            return result is not None
 
     # 6. Search Albums query
-    async def search_albums(self, query: str, limit: int = 10) -> List[DatabaseAlbum]:
-        """Search albums using the provided template"""
+    async def search_albums(
+        self, query: str, limit: int = 10, offset: int = 0
+    ) -> List[DatabaseAlbum]:
+        """Search albums by full-text match on name/artist, falling back to a substring"""
         async with get_db() as conn:
             results = await conn.fetch(
                 """
@@ -177,16 +219,56 @@ class DatabaseService:
                        artist_name,
                        name,
                        cover_art,
-                       release_date::date
+                       release_date
                 FROM   albums
-                WHERE  name LIKE $1
-                LIMIT  $2
+                WHERE  name_tsv @@ plainto_tsquery('simple', $1)
+                ORDER  BY ts_rank(name_tsv, plainto_tsquery('simple', $1)) DESC,
+                          album_id
+                LIMIT  $2 OFFSET $3
             """,
-                f"%{query}%",
+                query,
                 limit,
+                offset,
             )
 
-            return [DatabaseAlbum(**dict(r)) for r in results]
+            # Partial words don't match full-text search, so try them as a
+            # substring of the name, served by the trigram index and ranked by
+            # how closely the whole name resembles the query. The strategy has
+            # to hold for every page, so an empty page past the last full-text
+            # hit stays empty rather than switching to the substring matches
+            if not results and (
+                offset == 0
+                or not await conn.fetchval(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1
+                        FROM   albums
+                        WHERE  name_tsv @@ plainto_tsquery('simple', $1)
+                    )
+                """,
+                    query,
+                )
+            ):
+                results = await conn.fetch(
+                    """
+                    SELECT album_id,
+                           artist_name,
+                           name,
+                           cover_art,
+                           release_date
+                    FROM   albums
+                    WHERE  name ILIKE $1
+                    ORDER  BY similarity(name, $4) DESC, name, album_id
+                    LIMIT  $2 OFFSET $3
+                """,
+                    f"%{query}%",
+                    limit,
+                    offset,
+                    query,
+                )
+
+            # Rows are already typed by the database, so skip re-validation
+            return [DatabaseAlbum.model_construct(**r) for r in results]
 
     # 7. Fetch Album Data query
     async def fetch_album_data(
@@ -194,32 +276,25 @@ class DatabaseService:
     ) -> List[StreamResponse]:
         """Fetch album data using the provided template with percentage change calculation"""
         async with get_db() as conn:
-            # Convert time_period to days as string for SQL
-            days = "7" if time_period == "7d" else "30"
+            # Convert time_period to a day count bound as an integer parameter
+            days = 7 if time_period == "7d" else 30
 
-            # First get the album data
-            album_result = await conn.fetchrow(
-                """
-                SELECT album_id,
-                       name,
-                       artist_name,
-                       cover_art,
-                       release_date::date
-                FROM albums
-                WHERE album_id = $1
-                """,
-                album_id,
-            )
-
-            if not album_result:
-                return []
-
-            album = DatabaseAlbum(**dict(album_result))
-
-            # Get all stream counts for each track within the specified time period
+            # Get the album and all stream counts for each of its tracks within
+            # the specified time period in one round-trip
             results = await conn.fetch(
                 """
-                with period_streams as (
+                with album as (
+                    select
+                        album_id,
+                        name,
+                        artist_name,
+                        cover_art,
+                        release_date
+                    from
+                        albums
+                    where
+                        album_id = $1
+                ), period_streams as (
                     select
                         s.album_id,
                         s.track_id,
@@ -229,7 +304,7 @@ class DatabaseService:
                         streams s
                     where
                         s.album_id = $1
-                        and s.timestamp >= CURRENT_TIMESTAMP - ($2 || ' days')::interval
+                        and s.timestamp >= CURRENT_TIMESTAMP - $2::int * INTERVAL '1 day'
                         and s.play_count > 0
                 ), track_metrics as (
                     select
@@ -255,17 +330,21 @@ class DatabaseService:
                     t.name as track_name,
                     t.track_id,
                     t.album_id,
+                    a.name as album_name,
+                    a.artist_name,
+                    a.cover_art,
+                    a.release_date,
                     coalesce(ps.play_count, 0) as play_count,
                     coalesce(ps.timestamp, CURRENT_TIMESTAMP) as stream_recorded_at,
                     coalesce(tc.pct_change, 0.0) as pct_change
                 from
-                    tracks t
+                    album a
+                join
+                    tracks t on t.album_id = a.album_id
                 left join
                     period_streams ps on ps.track_id = t.track_id
                 left join
                     track_changes tc on tc.track_id = t.track_id
-                where
-                    t.album_id = $1
                 order by
                     t.track_id, ps.timestamp desc
                 """,
@@ -273,26 +352,40 @@ class DatabaseService:
                 days,
             )
 
-            # Create StreamResponse objects with percentage changes
+            if not results:
+                return []
+
+            # Album columns are the same on every row, so build the album once
+            first = results[0]
+            album = DatabaseAlbum.model_construct(
+                album_id=first["album_id"],
+                name=first["album_name"],
+                artist_name=first["artist_name"],
+                cover_art=first["cover_art"],
+                release_date=first["release_date"],
+            )
+
+            # Create StreamResponse objects with percentage changes; the row
+            # models come straight from typed columns, so build them unvalidated
             streams = []
             for r in results:
-                track = DatabaseTrack(
+                track = DatabaseTrack.model_construct(
                     track_id=r["track_id"],
                     track_name=r["track_name"],
                     album_id=r["album_id"],
                 )
-                stream = DatabaseStream(
+                stream = DatabaseStream.model_construct(
                     track_id=r["track_id"],
                     album_id=r["album_id"],
-                    play_count=r["play_count"] or 0,
-                    timestamp=r["stream_recorded_at"] or datetime.now(),
+                    play_count=r["play_count"],
+                    timestamp=r["stream_recorded_at"],
                 )
                 streams.append(
                     StreamResponse.from_database_with_pct_change(
                         stream,
                         track,
                         album,
-                        pct_change=r["pct_change"] or 0.0,
+                        pct_change=r["pct_change"],
                         time_period=time_period,
                     )
                 )
@@ -302,50 +395,72 @@ class DatabaseService:
     # Composite operations using bulk operations for better performance
     async def save_complete_album(self, streams: List[StreamResponse]) -> Dict:
         """Save a complete album with its tracks and stream counts using bulk operations"""
-        logger.info(f"[DB] save_complete_album called with {len(streams)} streams")
+        logger.info("[DB] save_complete_album called with %d streams", len(streams))
         if not streams:
             logger.error("[DB] No streams to save")
             return {"status": "error", "message": "No streams to save"}
-        async with get_db() as conn:
-            async with conn.transaction():
-                try:
+        try:
+            # Build every row before taking a connection, so the transaction
+            # only spans the database round-trips
+            album = DatabaseAlbum(
+                album_id=streams[0].album_id,
+                name=streams[0].album_name,
+                artist_name=streams[0].artist_name,
+                cover_art=streams[0].cover_art,
+                release_date=streams[0].release_date
+                if isinstance(streams[0].release_date, datetime)
+                else _parse_utc_timestamp(streams[0].release_date),
+            )
+
+            # An upsert can't touch the same row twice, so keep one entry
+            # per track_id
+            tracks_by_id = {
+                stream.track_id: (stream.track_name, stream.album_id)
+                for stream in streams
+            }
+
+            # Streams from one scrape share a timestamp, so parse each value once
+            timestamps = {
+                value: _parse_utc_timestamp(value)
+                for value in {stream.timestamp for stream in streams}
+            }
+            stream_data = [
+                (
+                    stream.track_id,
+                    stream.stream_count,
+                    stream.album_id,
+                    timestamps[stream.timestamp],
+                )
+                for stream in streams
+            ]
+
+            # Debug logging to check stream counts before saving
+            logger.debug("[DB] About to save %d streams", len(stream_data))
+            for i, (track_id, play_count, album_id, timestamp) in enumerate(
+                stream_data[:3]
+            ):  # Log first 3
+                logger.debug(
+                    "[DB] Stream %d: track_id=%s, play_count=%s, album_id=%s",
+                    i,
+                    track_id,
+                    play_count,
+                    album_id,
+                )
+
+            # Also log the original stream objects
+            for i, stream in enumerate(streams[:3]):  # Log first 3
+                logger.debug(
+                    "[DB] Original stream %d: track_id=%s, stream_count=%s",
+                    i,
+                    stream.track_id,
+                    stream.stream_count,
+                )
+
+            async with get_db() as conn:
+                async with conn.transaction():
                     # Insert album once
-                    album = DatabaseAlbum(
-                        album_id=streams[0].album_id,
-                        name=streams[0].album_name,
-                        artist_name=streams[0].artist_name,
-                        cover_art=streams[0].cover_art,
-                        release_date=streams[0].release_date
-                        if isinstance(streams[0].release_date, datetime)
-                        else datetime.strptime(
-                            streams[0].release_date, "%Y-%m-%dT%H:%M:%SZ"
-                        ),
-                    )
                     await conn.execute(
-                        """
-                        INSERT INTO albums (
-                            album_id,
-                            name,
-                            artist_name,
-                            cover_art,
-                            release_date
-                        )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3,
-                            $4,
-                            $5
-                        )
-                        ON CONFLICT (
-                            album_id
-                        )
-                        DO UPDATE SET
-                            name = $2,
-                            artist_name = $3,
-                            cover_art = $4,
-                            release_date = $5
-                    """,
+                        _UPSERT_ALBUM_SQL,
                         album.album_id,
                         album.name,
                         album.artist_name,
@@ -353,61 +468,36 @@ class DatabaseService:
                         album.release_date,
                     )
 
-                    # Bulk insert tracks
-                    track_data = [
-                        (stream.track_id, stream.track_name, stream.album_id)
-                        for stream in streams
-                    ]
-                    await conn.executemany(
+                    # Bulk insert tracks as one statement over columnar arrays
+                    await conn.execute(
                         """
                         INSERT INTO tracks (
                             track_id,
                             name,
                             album_id
                         )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3
-                        )
+                        SELECT *
+                        FROM unnest($1::text[], $2::text[], $3::text[])
                         ON CONFLICT (
                             track_id
                         )
                         DO UPDATE
                         SET
-                            name = $2,
-                            album_id = $3
+                            name = excluded.name,
+                            album_id = excluded.album_id
+                        WHERE (tracks.name, tracks.album_id)
+                            IS DISTINCT FROM (excluded.name, excluded.album_id)
                         """,
-                        track_data,
+                        list(tracks_by_id),
+                        [name for name, _ in tracks_by_id.values()],
+                        [album_id for _, album_id in tracks_by_id.values()],
                     )
 
                     # Bulk insert streams
-                    stream_data = [
-                        (
-                            stream.track_id,
-                            stream.stream_count,
-                            stream.album_id,
-                            datetime.strptime(stream.timestamp, "%Y-%m-%dT%H:%M:%SZ"),
-                        )
-                        for stream in streams
-                    ]
-
-                    # Debug logging to check stream counts before saving
-                    logger.info(f"[DB] DEBUG: About to save {len(stream_data)} streams")
-                    for i, (track_id, play_count, album_id, timestamp) in enumerate(
-                        stream_data[:3]
-                    ):  # Log first 3
-                        logger.info(
-                            f"[DB] DEBUG: Stream {i}: track_id={track_id}, play_count={play_count}, album_id={album_id}"
-                        )
-
-                    # Also log the original stream objects
-                    for i, stream in enumerate(streams[:3]):  # Log first 3
-                        logger.info(
-                            f"[DB] DEBUG: Original stream {i}: track_id={stream.track_id}, stream_count={stream.stream_count}"
-                        )
-
-                    await conn.executemany(
+                    track_ids, play_counts, album_ids, stream_times = zip(
+                        *stream_data
+                    )
+                    await conn.execute(
                         """
                         INSERT INTO streams (
                             track_id,
@@ -415,11 +505,9 @@ class DatabaseService:
                             album_id,
                             timestamp
                         )
-                        VALUES (
-                            $1,
-                            $2,
-                            $3,
-                            $4
+                        SELECT *
+                        FROM unnest(
+                            $1::text[], $2::int8[], $3::text[], $4::timestamp[]
                         )
                         ON CONFLICT (
                             track_id,
@@ -428,23 +516,27 @@ class DatabaseService:
                         )
                         DO NOTHING
                         """,
-                        stream_data,
+                        list(track_ids),
+                        list(play_counts),
+                        list(album_ids),
+                        list(stream_times),
                     )
 
-                    logger.info(
-                        f"[DB] save_complete_album finished for album_id={album.album_id} with {len(streams)} tracks using bulk operations"
-                    )
-                    return {
-                        "album_id": streams[0].album_id,
-                        "tracks_saved": len(streams),
-                        "streams_saved": len(streams),
-                        "status": "success",
-                    }
-                except Exception as e:
-                    logger.error(
-                        f"[DB][EXCEPTION] save_complete_album failed: {e}\n{traceback.format_exc()}"
-                    )
-                    return {"status": "error", "message": str(e)}
+            logger.info(
+                "[DB] save_complete_album finished for album_id=%s with %d tracks "
+                "using bulk operations",
+                album.album_id,
+                len(streams),
+            )
+            return {
+                "album_id": streams[0].album_id,
+                "tracks_saved": len(streams),
+                "streams_saved": len(streams),
+                "status": "success",
+            }
+        except Exception as e:
+            logger.exception("[DB][EXCEPTION] save_complete_album failed: %s", e)
+            return {"status": "error", "message": str(e)}
 
     # Additional utility operations
 
@@ -454,8 +546,8 @@ class DatabaseService:
             results = await conn.fetch(
                 """
                 SELECT
-                    distinct album_id
-                FROM tracks
+                    album_id
+                FROM albums
                 ORDER BY album_id DESC
                 LIMIT $1 OFFSET $2
             """,
@@ -467,8 +559,8 @@ class DatabaseService:
 
     async def fetch_top_tracks(self, time_period: str = "7d") -> List[StreamResponse]:
         async with get_db() as conn:
-            # Convert time_period to days as string for SQL
-            days = "7" if time_period == "7d" else "30"
+            # Convert time_period to a day count bound as an integer parameter
+            days = 7 if time_period == "7d" else 30
 
             results = await conn.fetch(
                 """
@@ -481,7 +573,7 @@ class DatabaseService:
                     from
                         streams
                     where
-                        timestamp >= CURRENT_TIMESTAMP - ($1 || ' days')::interval and
+                        timestamp >= CURRENT_TIMESTAMP - $1::int * INTERVAL '1 day' and
                         play_count > 0
                     group by
                         album_id,
@@ -529,7 +621,7 @@ class DatabaseService:
                     ls.track_id,
                     ls.stream_recorded_at,
                     ls.daily_play_count as play_count,
-                    tc.pct_change,
+                    coalesce(tc.pct_change, 0.0) as pct_change,
                     a.name as album_name,
                     a.cover_art,
                     a.release_date,
@@ -549,28 +641,41 @@ class DatabaseService:
                 """,
                 days,
             )
-            return [
-                StreamResponse.from_database_with_pct_change(
-                    DatabaseStream(
-                        track_id=row["track_id"],
-                        album_id=row["album_id"],
-                        play_count=row["play_count"] or 0,
-                        timestamp=row["stream_recorded_at"] or datetime.now(),
-                    ),
-                    DatabaseTrack(
+
+            # Each top track has one row per day, so build its track and album
+            # models once and share them across that track's rows
+            tracks: Dict[str, DatabaseTrack] = {}
+            albums: Dict[str, DatabaseAlbum] = {}
+            top_tracks = []
+            for row in results:
+                track = tracks.get(row["track_id"])
+                if track is None:
+                    track = tracks[row["track_id"]] = DatabaseTrack.model_construct(
                         track_id=row["track_id"],
                         track_name=row["track_name"],
                         album_id=row["album_id"],
-                    ),
-                    DatabaseAlbum(
+                    )
+                album = albums.get(row["album_id"])
+                if album is None:
+                    album = albums[row["album_id"]] = DatabaseAlbum.model_construct(
                         album_id=row["album_id"],
                         name=row["album_name"],
                         artist_name=row["artist_name"],
                         cover_art=row["cover_art"],
                         release_date=row["release_date"],
-                    ),
-                    pct_change=row["pct_change"] or 0.0,
-                    time_period=time_period,
+                    )
+                top_tracks.append(
+                    StreamResponse.from_database_with_pct_change(
+                        DatabaseStream.model_construct(
+                            track_id=row["track_id"],
+                            album_id=row["album_id"],
+                            play_count=row["play_count"],
+                            timestamp=row["stream_recorded_at"],
+                        ),
+                        track,
+                        album,
+                        pct_change=row["pct_change"],
+                        time_period=time_period,
+                    )
                 )
-                for row in results
-            ]
+            return top_tracks
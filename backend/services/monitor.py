@@ -1,5 +1,6 @@
 # services/monitor.py
 import asyncio
+import hashlib
 from datetime import datetime
 from typing import Any, Dict
 
@@ -7,6 +8,9 @@ from services.cockroach import get_db
 from services.official_spotify import OfficialSpotifyService
 from services.unofficial_spotify import TokenManager, UnofficialSpotifyService
 
+# Seconds between background service checks
+CHECK_INTERVAL = 10
+
 
 class ServiceMonitor:
     """
@@ -84,7 +88,7 @@ class ServiceMonitor:
             test_query = "Thriller Michael Jackson"
             albums = await self.official_spotify.search_albums(test_query, limit=1)
 
-            if albums and len(albums) > 0:
+            if albums:
                 service_info["status"] = "healthy"
                 service_info["error"] = None
             else:
@@ -144,6 +148,33 @@ class ServiceMonitor:
 
         return self.services
 
+    async def run_periodic_checks(self, interval: float = CHECK_INTERVAL) -> None:
+        """
+        Keep service statuses fresh in the background so status endpoints
+        only ever read the last result instead of checking on every request
+
+        Args:
+            interval: Seconds to wait between check rounds
+        """
+        while True:
+            await self.check_all_services()
+            await asyncio.sleep(interval)
+
+    def get_status_etag(self) -> str:
+        """
+        Build an ETag from the current service statuses
+
+        Returns:
+            Quoted ETag that changes whenever the health body would, including
+            each service's last_checked time
+        """
+        status_tuple = tuple(
+            (key, service["status"], service["error"], service["last_checked"])
+            for key, service in sorted(self.services.items())
+        )
+        digest = hashlib.blake2b(repr(status_tuple).encode(), digest_size=16)
+        return f'"{digest.hexdigest()}"'
+
     def get_status_summary(self) -> Dict[str, Any]:
         """
         Get a summary of all service statuses
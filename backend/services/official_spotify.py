@@ -1,9 +1,11 @@
 # services/official_spotify.py
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import spotipy
+from aiolimiter import AsyncLimiter
 from config import settings
 from models import DatabaseAlbum
 from spotipy.oauth2 import SpotifyClientCredentials
@@ -12,6 +14,25 @@ from spotipy.oauth2 import SpotifyClientCredentials
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("spotify_api")
 
+# Rate limit primitives shared by every OfficialSpotifyService in the process,
+# since the API routes and the service monitor each build their own instance.
+# Created on first use so they bind to the event loop that actually serves
+# requests (Python 3.9 binds asyncio primitives to the current loop when
+# they're constructed)
+_limiter: Optional[AsyncLimiter] = None
+_concurrency: Optional[asyncio.Semaphore] = None
+
+
+def _rate_limits() -> Tuple[asyncio.Semaphore, AsyncLimiter]:
+    """Return the shared concurrency cap and request rate limiter"""
+    global _limiter, _concurrency
+    if _concurrency is None:
+        # Spotify starts rate limiting above ~10 req/s, so keep at most
+        # 2 calls in flight and 10 per second
+        _limiter = AsyncLimiter(10, 1)
+        _concurrency = asyncio.Semaphore(2)
+    return _concurrency, _limiter
+
 
 class OfficialSpotifyService:
     """
@@ -29,19 +50,33 @@ class OfficialSpotifyService:
             )
         )
 
-    async def search_albums(self, query: str, limit: int = 50) -> List[DatabaseAlbum]:
+    async def _call(self, func, *args, **kwargs):
+        """
+        Run a blocking spotipy call in a worker thread so it doesn't stall
+        the event loop, staying within Spotify's rate limits
+        """
+        concurrency, limiter = _rate_limits()
+        async with concurrency, limiter:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def search_albums(
+        self, query: str, limit: int = 50, offset: int = 0
+    ) -> List[DatabaseAlbum]:
         """
         Search for albums on Spotify by name
 
         Args:
             query: Search query string
             limit: Maximum number of results to return (default: 50)
+            offset: Number of results to skip (default: 0)
 
         Returns:
             List of NewRelease objects matching the search query
         """
         # Use spotipy's search method with 'album' type
-        result = self.client.search(q=query, type="album", limit=limit)
+        result = await self._call(
+            self.client.search, q=query, type="album", limit=limit, offset=offset
+        )
 
         albums = []
         for item in result["albums"]["items"]:
@@ -88,5 +123,5 @@ class OfficialSpotifyService:
         """
         Get album details from Spotify by album ID.
         """
-        album = self.client.album(album_id)
+        album = await self._call(self.client.album, album_id)
         return album
@@ -21,6 +21,9 @@ from services.token_manager import TokenManager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("spotify_api")
 
+# Longest we'll wait on a Retry-After before trying again, in seconds
+MAX_RETRY_DELAY = 60
+
 
 class UnofficialSpotifyService:
     """
@@ -32,7 +35,11 @@ class UnofficialSpotifyService:
     def __init__(self, token_manager: TokenManager):
         self.base_url = "https://api-partner.spotify.com/pathfinder/v1/query"
         self.token_manager = token_manager
-        self.client = httpx.AsyncClient(timeout=30.0)  # Increased timeout
+        # Long-lived client so TLS connections to Spotify are kept alive and reused
+        self.client = httpx.AsyncClient(
+            timeout=30.0,  # Increased timeout
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
         self.max_retries = 3
 
     async def _get_headers(self) -> Dict[str, str]:
@@ -46,6 +53,21 @@ class UnofficialSpotifyService:
             "spotify-app-version": "1.2.59.53.gb992eb8d",
         }
 
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """Seconds to wait before a retry, honouring Retry-After on a 429"""
+        backoff = 2**attempt  # Exponential backoff
+        if (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code == 429
+        ):
+            retry_after = error.response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                # Cap what the server asks for; a long pause would hold the
+                # Celery worker, and the task schedule retries later anyway
+                return min(max(int(retry_after), backoff), MAX_RETRY_DELAY)
+        return backoff
+
     def _build_album_query(self, album_id: str) -> str:
         """Build GraphQL query URL for album data"""
         variables = {
@@ -138,20 +160,25 @@ class UnofficialSpotifyService:
                 response.raise_for_status()
                 data = response.json()
 
-                # Debug log the response structure
-                logger.info("API Response structure:")
-                logger.info(f"Data keys: {list(data.keys())}")
-                if "data" in data:
-                    logger.info(f"Data['data'] keys: {list(data['data'].keys())}")
-                    if "albumUnion" in data["data"]:
-                        album_data = data["data"]["albumUnion"]
-                        logger.info(f"Album data keys: {list(album_data.keys())}")
-                        if "artists" in album_data:
-                            logger.info(f"Artists structure: {album_data['artists']}")
-                        if "tracksV2" in album_data:
-                            logger.info(
-                                f"First track structure: {album_data['tracksV2']['items'][0] if album_data['tracksV2']['items'] else 'No tracks'}"
-                            )
+                # Debug log the response structure, only walked when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("API Response structure:")
+                    logger.debug("Data keys: %s", list(data.keys()))
+                    if "data" in data:
+                        logger.debug("Data['data'] keys: %s", list(data["data"].keys()))
+                        if "albumUnion" in data["data"]:
+                            album_data = data["data"]["albumUnion"]
+                            logger.debug("Album data keys: %s", list(album_data.keys()))
+                            if "artists" in album_data:
+                                logger.debug(
+                                    "Artists structure: %s", album_data["artists"]
+                                )
+                            if "tracksV2" in album_data:
+                                items = album_data["tracksV2"]["items"]
+                                logger.debug(
+                                    "First track structure: %s",
+                                    items[0] if items else "No tracks",
+                                )
 
                 # Check for expected data structure
                 if "data" not in data or "albumUnion" not in data["data"]:
@@ -171,8 +198,8 @@ class UnofficialSpotifyService:
                         artist_name = album_data["artists"]["items"][0]["profile"][
                             "name"
                         ]
-                        logger.info(
-                            f"Found artist name from album artists: {artist_name}"
+                        logger.debug(
+                            "Found artist name from album artists: %s", artist_name
                         )
                     # If not found, try the first track's artist
                     elif "tracksV2" in album_data and "items" in album_data["tracksV2"]:
@@ -184,17 +211,17 @@ class UnofficialSpotifyService:
                             artist_name = first_track["artists"]["items"][0]["profile"][
                                 "name"
                             ]
-                            logger.info(
-                                f"Found artist name from first track: {artist_name}"
+                            logger.debug(
+                                "Found artist name from first track: %s", artist_name
                             )
                     # If still not found, try the album's name as a fallback
                     if not artist_name and "name" in album_data:
                         artist_name = album_data["name"].split(" - ")[
                             0
                         ]  # Common format: "Artist - Album"
-                        logger.info(f"Using album name as artist name: {artist_name}")
+                        logger.debug("Using album name as artist name: %s", artist_name)
                 except Exception as e:
-                    logger.error(f"Error extracting artist name: {e}")
+                    logger.error("Error extracting artist name: %s", e)
                     # Don't raise here, we'll try to continue with empty artist name
 
                 # Extract cover art URL - get the largest image available
@@ -221,7 +248,7 @@ class UnofficialSpotifyService:
                             else datetime.strptime(release_date_str, "%Y-%m-%d")
                         )
                     except Exception as e:
-                        logger.error(f"Error parsing release date: {e}")
+                        logger.error("Error parsing release date: %s", e)
 
                 # Validate tracks section exists
                 if (
@@ -230,6 +257,9 @@ class UnofficialSpotifyService:
                 ):
                     raise ValueError("Track data missing in API response")
 
+                # Every track in this response shares one scrape timestamp
+                scraped_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+
                 # Process tracks
                 output_data = []
                 for item in album_data["tracksV2"]["items"]:
@@ -245,8 +275,11 @@ class UnofficialSpotifyService:
 
                         # Create a StreamResponse object
                         playcount = track_data.get("playcount", 0)
-                        logger.info(
-                            f"[API] DEBUG: Track '{track_data['name']}' has playcount: {playcount} (type: {type(playcount)})"
+                        logger.debug(
+                            "[API] Track '%s' has playcount: %s (type: %s)",
+                            track_data["name"],
+                            playcount,
+                            type(playcount),
                         )
 
                         stream = StreamResponse(
@@ -256,13 +289,13 @@ class UnofficialSpotifyService:
                             album_name=album_data["name"],
                             artist_name=track_artist_name,
                             stream_count=playcount,
-                            timestamp=datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                            timestamp=scraped_at,
                             cover_art=cover_art_url,
                             release_date=release_date,
                         )
                         output_data.append(stream)
                     except Exception as e:
-                        logger.error(f"Error processing track: {e}")
+                        logger.error("Error processing track: %s", e)
                         continue
 
                 return output_data
@@ -270,7 +303,7 @@ class UnofficialSpotifyService:
             except Exception as e:
                 errors.append(str(e))
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                    await asyncio.sleep(self._retry_delay(e, attempt))
                 continue
 
         # If we get here, all retries failed
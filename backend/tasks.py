@@ -1,7 +1,6 @@
 # tasks.py
 import asyncio
 import logging
-import traceback
 
 from celery_init import app
 from services.cockroach import DatabaseService
@@ -71,12 +70,25 @@ album_tracker = AlbumTracker()
 db_singleton = DatabaseServiceSingleton()
 spotify_singleton = SpotifyServiceSingleton()
 
+# Event loop reused by every task in this worker process, so the database
+# pool and HTTP clients stay connected between tasks
+_loop = None
+
+
+def run_async(coro):
+    """Run a coroutine on this worker process's long-lived event loop"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
 
 # Task 1: Fetch a batch of albums (first box in diagram)
 @app.task
 def fetch_albums_batch():
     """Fetch a batch of albums from database and distribute work"""
-    return asyncio.run(_fetch_albums_batch_async())
+    return run_async(_fetch_albums_batch_async())
 
 
 async def _fetch_albums_batch_async():
@@ -92,7 +104,7 @@ async def _fetch_albums_batch_async():
 
     # If no albums found, reset tracker and return
     if not albums:
-        print("No more albums to process, resetting tracker")
+        logger.info("No more albums to process, resetting tracker")
         album_tracker.reset()
         return {"status": "complete", "message": "No more albums to process"}
 
@@ -110,43 +122,47 @@ async def _fetch_albums_batch_async():
 # Task 2: Fetch metrics for a single album (middle boxes in diagram)
 @app.task(rate_limit="200/m")
 def fetch_album_metrics(album):
-    logger.info(f"[START] fetch_album_metrics for album: {album}")
+    logger.info("[START] fetch_album_metrics for album: %s", album)
     try:
-        result = asyncio.run(_fetch_album_metrics_async(album))
+        result = run_async(_fetch_album_metrics_async(album))
         logger.info(
-            f"[END] fetch_album_metrics for album: {album['album_id']} result: {result}"
+            "[END] fetch_album_metrics for album: %s result: %s",
+            album["album_id"],
+            result,
         )
         return result
     except Exception as e:
-        logger.error(
-            f"[EXCEPTION] fetch_album_metrics for album: {album['album_id']}: {e}\n{traceback.format_exc()}"
+        logger.exception(
+            "[EXCEPTION] fetch_album_metrics for album: %s: %s", album["album_id"], e
         )
         return {"album_id": album["album_id"], "status": "error", "error": str(e)}
 
 
 async def _fetch_album_metrics_async(album):
-    logger.info(f"[ASYNC] Fetching metrics for album: {album}")
+    logger.info("[ASYNC] Fetching metrics for album: %s", album)
     spotify = spotify_singleton.get_service()
     db_service = db_singleton.get_service()
     try:
-        logger.info(f"[ASYNC] Calling Spotify API for album_id: {album['album_id']}")
+        logger.info("[ASYNC] Calling Spotify API for album_id: %s", album["album_id"])
         streams = await spotify.get_album_tracks(album["album_id"])
         logger.info(
-            f"[ASYNC] Spotify returned {len(streams) if streams else 0} streams for album_id: {album['album_id']}"
+            "[ASYNC] Spotify returned %d streams for album_id: %s",
+            len(streams) if streams else 0,
+            album["album_id"],
         )
-        logger.debug(f"[ASYNC] Spotify streams data: {streams}")
+        logger.debug("[ASYNC] Spotify streams data: %s", streams)
         streams_saved = 0
         if streams:
             logger.info(
-                f"[ASYNC] Saving streams to DB for album_id: {album['album_id']}"
+                "[ASYNC] Saving streams to DB for album_id: %s", album["album_id"]
             )
             result = await db_service.save_complete_album(streams)
-            logger.info(f"[ASYNC] DB save result: {result}")
+            logger.info("[ASYNC] DB save result: %s", result)
             if result.get("status") == "success":
                 streams_saved = len(streams)
             else:
                 logger.error(
-                    f"[ASYNC] Error saving album streams: {result.get('message')}"
+                    "[ASYNC] Error saving album streams: %s", result.get("message")
                 )
         return {
             "album_id": album["album_id"],
@@ -154,9 +170,7 @@ async def _fetch_album_metrics_async(album):
             "streams_saved": streams_saved,
         }
     except Exception as e:
-        logger.error(
-            f"[ASYNC][EXCEPTION] Error fetching album metrics: {str(e)}\n{traceback.format_exc()}"
-        )
+        logger.exception("[ASYNC][EXCEPTION] Error fetching album metrics: %s", e)
         return {"album_id": album["album_id"], "status": "error", "error": str(e)}
 
 
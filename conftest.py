@@ -4,4 +4,9 @@ from pathlib import Path
 # Add the project root directory to Python path
 project_root = str(Path(__file__).parent)
 if project_root not in sys.path:
-    sys.path.append(project_root)
\ No newline at end of file
+    sys.path.append(project_root)
+
+# The backend imports its modules top-level (config, models, services...)
+backend_root = str(Path(__file__).parent / "backend")
+if backend_root not in sys.path:
+    sys.path.append(backend_root)
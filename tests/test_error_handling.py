@@ -0,0 +1,31 @@
+# tests/test_error_handling.py
+import os
+
+# routes.dependencies builds the Spotify client at import, which needs credentials
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "test-client-id")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "test-client-secret")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from main import app  # noqa: E402
+from services.monitor import monitor  # noqa: E402
+
+ORIGIN = "http://localhost:5173"
+
+
+def test_route_error_returns_500_with_cors_headers(monkeypatch):
+    """An unhandled route error becomes a generic 500 the browser can read"""
+
+    def fail():
+        raise RuntimeError("database password is hunter2")
+
+    monkeypatch.setattr(monitor, "get_status_summary", fail)
+
+    # No lifespan: the request must not need the database or the checker.
+    # Server exceptions still raise here, so a 500 proves the middleware caught it
+    client = TestClient(app)
+    response = client.get("/", headers={"Origin": ORIGIN})
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
+    # allow_origins includes "*", so CORS answers with either the origin or "*"
+    assert response.headers["access-control-allow-origin"] in (ORIGIN, "*")
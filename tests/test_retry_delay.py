@@ -0,0 +1,48 @@
+# tests/test_retry_delay.py
+import httpx
+from services.unofficial_spotify import MAX_RETRY_DELAY, UnofficialSpotifyService
+
+URL = "https://api-partner.spotify.com/pathfinder/v1/query"
+
+
+def _status_error(status_code, headers=None):
+    """Build the error raise_for_status() gives for a response"""
+    request = httpx.Request("GET", URL)
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_retry_after_seconds_used_on_429():
+    """A numeric Retry-After on a 429 sets the delay"""
+    error = _status_error(429, {"Retry-After": "5"})
+    assert UnofficialSpotifyService._retry_delay(error, 0) == 5
+
+
+def test_retry_after_never_shorter_than_backoff():
+    """A Retry-After below the exponential backoff doesn't shorten it"""
+    error = _status_error(429, {"Retry-After": "1"})
+    assert UnofficialSpotifyService._retry_delay(error, 2) == 4
+
+
+def test_retry_after_is_capped():
+    """A huge Retry-After is capped so the worker isn't held"""
+    error = _status_error(429, {"Retry-After": "86400"})
+    assert UnofficialSpotifyService._retry_delay(error, 0) == MAX_RETRY_DELAY
+
+
+def test_non_numeric_retry_after_falls_back_to_backoff():
+    """HTTP-date Retry-After values aren't parsed"""
+    error = _status_error(429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+    assert UnofficialSpotifyService._retry_delay(error, 1) == 2
+
+
+def test_missing_retry_after_falls_back_to_backoff():
+    """A 429 without Retry-After uses the exponential backoff"""
+    assert UnofficialSpotifyService._retry_delay(_status_error(429), 1) == 2
+
+
+def test_other_errors_use_backoff():
+    """Retry-After is only honoured on a 429"""
+    error = _status_error(503, {"Retry-After": "30"})
+    assert UnofficialSpotifyService._retry_delay(error, 1) == 2
+    assert UnofficialSpotifyService._retry_delay(ValueError("bad"), 2) == 4
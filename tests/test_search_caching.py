@@ -0,0 +1,120 @@
+# tests/test_search_caching.py
+import asyncio
+import os
+
+import pytest
+
+# routes.dependencies builds the Spotify client at import, which needs credentials
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "test-client-id")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "test-client-secret")
+
+from routes import search  # noqa: E402
+from routes.caching import etag_matches  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+ETAG = '"abc123"'
+
+
+def _request(if_none_match=None):
+    """Build a bare GET request for the top tracks route"""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/search/top-tracks",
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ("", False),
+        (ETAG, True),
+        ('"other"', False),
+        (f'"other", {ETAG}', True),
+        (f"W/{ETAG}", True),
+        (f'"other", W/{ETAG}', True),
+        ("*", True),
+        (" * ", True),
+    ],
+)
+def test_etag_matches(header, expected):
+    """If-None-Match accepts lists, weak validators and *"""
+    assert etag_matches(header, ETAG) is expected
+
+
+@pytest.mark.asyncio
+async def test_cached_top_tracks_max_age_follows_redis_ttl(monkeypatch):
+    """A cache hit tells clients to keep it only as long as Redis will"""
+
+    async def cached(redis, cache_key):
+        return b"[]", ETAG, 42
+
+    monkeypatch.setattr(search, "_get_cached_top_tracks", cached)
+
+    response = await search.top_tracks(_request(), "7d", None, None, None)
+    assert response.status_code == 200
+    assert response.body == b"[]"
+    assert response.headers["etag"] == ETAG
+    assert response.headers["cache-control"] == "public, max-age=42"
+
+    response = await search.top_tracks(_request(f"W/{ETAG}"), "7d", None, None, None)
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == "public, max-age=42"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_top_tracks_misses_share_one_load(monkeypatch):
+    """Concurrent cache misses in one worker run a single database query"""
+
+    async def miss(redis, cache_key):
+        return None
+
+    stored = []
+
+    async def store(redis, cache_key, body, etag):
+        stored.append(cache_key)
+
+    monkeypatch.setattr(search, "_get_cached_top_tracks", miss)
+    monkeypatch.setattr(search, "_set_cached_top_tracks", store)
+
+    release = asyncio.Event()
+
+    class FakeDatabaseService:
+        calls = 0
+
+        async def fetch_top_tracks(self, time_period):
+            self.calls += 1
+            await release.wait()
+            return []
+
+    db_service = FakeDatabaseService()
+    requests = [
+        asyncio.ensure_future(
+            search.top_tracks(_request(), "7d", db_service, None, None)
+        )
+        for _ in range(3)
+    ]
+    # Let every request reach the in-flight load before it finishes
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(*requests)
+
+    assert db_service.calls == 1
+    assert stored == [search._TOP_TRACKS_CACHE_PREFIX + "7d"]
+    assert {response.body for response in responses} == {b"[]"}
+    assert {response.headers["etag"] for response in responses} == {
+        responses[0].headers["etag"]
+    }
+    assert (
+        responses[0].headers["cache-control"]
+        == f"public, max-age={search._TOP_TRACKS_CACHE_TTL}"
+    )
+    assert not search._top_tracks_inflight
@@ -0,0 +1,167 @@
+# tests/test_search_paging.py
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import orjson
+import pytest
+
+# routes.dependencies builds the Spotify client at import, which needs credentials
+os.environ.setdefault("SPOTIFY_CLIENT_ID", "test-client-id")
+os.environ.setdefault("SPOTIFY_CLIENT_SECRET", "test-client-secret")
+
+from models import DatabaseAlbum  # noqa: E402
+from routes import search  # noqa: E402
+from services import cockroach  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+
+def _album(album_id, name):
+    """Build an album row shaped like the search query's columns"""
+    return {
+        "album_id": album_id,
+        "artist_name": "Artist",
+        "name": name,
+        "cover_art": "",
+        "release_date": datetime(2024, 1, 1),
+    }
+
+
+class FakeConnection:
+    """
+    Answers DatabaseService.search_albums' statements from an in-memory table:
+    full-text search matches whole words, ILIKE matches substrings
+    """
+
+    def __init__(self, albums):
+        self.albums = albums
+        self.statements = []
+
+    def _full_text(self, query):
+        words = set(query.lower().split())
+        return [a for a in self.albums if words <= set(a["name"].lower().split())]
+
+    async def fetch(self, sql, *args):
+        if "ILIKE" in sql:
+            self.statements.append("ilike")
+            pattern, limit, offset = args[0].strip("%").lower(), args[1], args[2]
+            rows = sorted(
+                (a for a in self.albums if pattern in a["name"].lower()),
+                key=lambda a: (a["name"], a["album_id"]),
+            )
+        else:
+            self.statements.append("fts")
+            query, limit, offset = args
+            rows = sorted(self._full_text(query), key=lambda a: a["album_id"])
+        return rows[offset : offset + limit]
+
+    async def fetchval(self, sql, query):
+        self.statements.append("exists")
+        return bool(self._full_text(query))
+
+
+class FakeOfficialSpotify:
+    """Records search calls and returns one album"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def search_albums(self, query, limit=50, offset=0):
+        self.calls.append((query, limit, offset))
+        return [DatabaseAlbum(**_album("spotify1", "Spotify Album"))]
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """Point DatabaseService at a fake connection holding a few albums"""
+    conn = FakeConnection(
+        [
+            _album("fts1", "Midnights"),
+            _album("fts2", "Midnights Remixes"),
+            # Only a substring of the query, so full-text search skips it
+            _album("sub1", "Midnightss"),
+            _album("sub2", "Folklore"),
+            _album("sub3", "Folklorico"),
+            _album("sub4", "Folksy"),
+        ]
+    )
+
+    @asynccontextmanager
+    async def get_db():
+        yield conn
+
+    monkeypatch.setattr(cockroach, "get_db", get_db)
+    return conn
+
+
+def _request():
+    """Build a bare GET request for the album search route"""
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/search/albums",
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+async def _search(query, limit, offset, official_spotify):
+    """Call the album search route and return the album ids it served"""
+    response = await search.search_albums(
+        _request(),
+        query,
+        limit,
+        offset,
+        False,
+        cockroach.DatabaseService(),
+        official_spotify,
+    )
+    assert response.status_code == 200
+    return [album["album_id"] for album in orjson.loads(response.body)]
+
+
+@pytest.mark.asyncio
+async def test_empty_page_after_last_full_text_hit_stays_empty(database):
+    """Paging past the full-text hits doesn't switch to substring matches"""
+    official_spotify = FakeOfficialSpotify()
+
+    assert await _search("midnights", 2, 0, official_spotify) == ["fts1", "fts2"]
+    database.statements.clear()
+
+    assert await _search("midnights", 2, 2, official_spotify) == []
+    assert "ilike" not in database.statements
+    assert official_spotify.calls == []
+
+
+@pytest.mark.asyncio
+async def test_substring_only_match_pages_through_ilike(database):
+    """A query with no full-text hits pages through the substring matches"""
+    official_spotify = FakeOfficialSpotify()
+
+    assert await _search("folk", 2, 0, official_spotify) == ["sub2", "sub3"]
+    assert await _search("folk", 2, 2, official_spotify) == ["sub4"]
+    assert await _search("folk", 2, 4, official_spotify) == []
+    assert official_spotify.calls == []
+
+
+@pytest.mark.asyncio
+async def test_no_database_match_falls_through_to_spotify(database):
+    """Without any database match, Spotify is asked for the same page"""
+    official_spotify = FakeOfficialSpotify()
+
+    assert await _search("thriller", 10, 20, official_spotify) == ["spotify1"]
+    assert official_spotify.calls == [("thriller", 10, 20)]
+
+
+@pytest.mark.asyncio
+async def test_spotify_fallback_stays_within_its_result_window(database):
+    """Pages past Spotify's first 1000 results aren't requested from it"""
+    official_spotify = FakeOfficialSpotify()
+
+    assert await _search("thriller", 10, 995, official_spotify) == ["spotify1"]
+    assert official_spotify.calls == [("thriller", 5, 995)]
+
+    assert await _search("thriller", 10, 1000, official_spotify) == []
+    assert official_spotify.calls == [("thriller", 5, 995)]